@@ -22,6 +22,12 @@ NUM_CELLS = 24
 NUM_LINKS = 3  # Link 1, 2, 3
 CELLS_PER_LINK = NUM_CELLS // NUM_LINKS  # 8
 
+# Data loading
+LOADER_WORKERS = 8  # threads used to read .dat files concurrently
+
+# API
+INPUT_CHECK_INTERVAL_S = 5.0  # min seconds between checks of input .dat files for changes
+
 def ensure_dirs():
     """Create data and output directories if they don't exist."""
     for d in (THROUGHPUT_DIR, PACKET_STATS_DIR, OUTPUT_DIR):
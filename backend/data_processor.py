@@ -2,15 +2,29 @@
 Fronthaul data processing: load .dat files, normalize time, extract features,
 and infer topology via correlated packet loss (cells on same link).
 """
+from __future__ import annotations
+
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, NamedTuple
 
 import numpy as np
 import pandas as pd
 from sklearn.cluster import AgglomerativeClustering
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to json
+    orjson = None
+
+try:
+    import pyarrow.csv as pa_csv
+    from pyarrow import ArrowInvalid
+except ImportError:  # pyarrow is optional; fall back to pd.read_csv
+    pa_csv = None
+
 from backend.config import (
     THROUGHPUT_DIR,
     PACKET_STATS_DIR,
@@ -19,72 +33,136 @@ from backend.config import (
     SLOT_DURATION_US,
     NUM_CELLS,
     NUM_LINKS,
+    LOADER_WORKERS,
     ensure_dirs,
 )
 
 
+# Bytes per symbol -> Gbps: x SYMBOLS_PER_SLOT bytes per slot, x 8 bits, / slot duration, / 1e9
+GBPS_SCALE = SYMBOLS_PER_SLOT * 8 / (SLOT_DURATION_US / 1e6) / 1e9
+
+# Trailing 1-2 digit number right before the extension, e.g. run2_cell_05.dat -> 05
+_CELL_ID_RE = re.compile(r"(?<!\d)(\d{1,2})(?=\.dat$)", re.I)
+
+
+# --- Per-cell records (one contiguous NumPy array per column) ---
+class CellThroughput(NamedTuple):
+    slot: np.ndarray
+    throughput_raw: np.ndarray
+    throughput_gbps: np.ndarray
+
+
+class CellPacketStats(NamedTuple):
+    slot: np.ndarray
+    packets_sent: np.ndarray
+    packets_lost: np.ndarray
+    loss_rate: np.ndarray
+
+
 # --- Helpers ---
-def _detect_delimiter(filepath: Path) -> str:
-    """Detect delimiter (tab or comma) from first line."""
-    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-        first = f.readline()
-    if "\t" in first:
+def _detect_delimiter(f: BinaryIO) -> str:
+    """Detect delimiter (tab or comma) from first line; rewinds the handle for parsing."""
+    first = f.readline()
+    f.seek(0)
+    if b"\t" in first:
         return "\t"
     return ","
 
 
+def _read_dat(filepath: Path) -> pd.DataFrame:
+    """
+    Read a headerless delimited .dat file. Uses Arrow's multithreaded CSV parser when available,
+    else np.loadtxt for all-numeric files, else pd.read_csv. Files Arrow rejects (e.g. a short
+    last row) go through the same fallbacks, so they load exactly as they would without pyarrow.
+    """
+    with open(filepath, "rb") as f:
+        delim = _detect_delimiter(f)
+        if pa_csv is not None:
+            try:
+                table = pa_csv.read_csv(
+                    f,
+                    read_options=pa_csv.ReadOptions(autogenerate_column_names=True),
+                    parse_options=pa_csv.ParseOptions(delimiter=delim),
+                )
+                return table.to_pandas()
+            except ArrowInvalid:
+                f.seek(0)
+        # Known-schema numeric files: np.loadtxt skips pandas' type inference. Files with a
+        # blank first line (incl. empty files, where loadtxt warns) are left to pd.read_csv
+        if f.readline().strip():
+            f.seek(0)
+            try:
+                return pd.DataFrame(np.loadtxt(f, delimiter=delim, ndmin=2, comments=None))
+            except ValueError:
+                pass
+        f.seek(0)
+        # Mixed/non-numeric content: no dtype pin (the loaders coerce), but skip NA-token scanning
+        return pd.read_csv(f, sep=delim, header=None, skipinitialspace=True, engine="c", na_filter=False)
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """Write obj as indented JSON, with orjson when available."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    with open(path, "w") as f:
+        json.dump(obj, f, indent=2)
+
+
+def _reduce_links(per_cell: np.ndarray, link_of_cell: np.ndarray, num_links: int) -> np.ndarray:
+    """Sum (cell x slot) rows into (link x slot) totals."""
+    link_totals = np.zeros((num_links, per_cell.shape[1]))
+    np.add.at(link_totals, link_of_cell, per_cell)
+    return link_totals
+
+
 def _normalize_symbols_to_slots(symbols_series: pd.Series) -> pd.Series:
     """Convert symbol index to slot index (1 slot = 14 symbols)."""
     return (symbols_series / SYMBOLS_PER_SLOT).astype(int)
 
 
-def load_throughput_file(filepath: Path) -> pd.DataFrame | None:
-    """Load one throughput .dat file; return DataFrame with columns [slot, cell_id, throughput_bps] or similar."""
+def load_throughput_file(filepath: Path) -> CellThroughput | None:
+    """Load one throughput .dat file; return its slot, raw and Gbps columns as arrays."""
     try:
-        delim = _detect_delimiter(filepath)
-        df = pd.read_csv(filepath, sep=delim, header=None, skipinitialspace=True)
+        df = _read_dat(filepath)
         # Expect at least: time/symbols, value (and optionally cell id in filename)
         if df.shape[1] < 2:
             return None
-        df.columns = [f"col_{i}" for i in range(df.shape[1])]
-        time_col = df.columns[0]
-        value_col = df.columns[1]
+        time_col = df.iloc[:, 0]
         # Normalize time to slots if numeric
-        if pd.api.types.is_numeric_dtype(df[time_col]):
-            df["slot"] = _normalize_symbols_to_slots(pd.to_numeric(df[time_col], errors="coerce"))
+        if pd.api.types.is_numeric_dtype(time_col):
+            slot = _normalize_symbols_to_slots(pd.to_numeric(time_col, errors="coerce")).to_numpy()
         else:
-            df["slot"] = np.arange(len(df)) // SYMBOLS_PER_SLOT
-        df["throughput_raw"] = pd.to_numeric(df[value_col], errors="coerce").fillna(0)
-        # Throughput in Gbps: raw can be bytes per symbol (e.g. sample .dat) -> bytes per slot = raw * SYMBOLS_PER_SLOT, then bps then Gbps
-        bytes_per_slot = df["throughput_raw"] * SYMBOLS_PER_SLOT
-        df["throughput_gbps"] = (bytes_per_slot * 8 / (SLOT_DURATION_US / 1e6)) / 1e9
-        return df[["slot", "throughput_raw", "throughput_gbps"]].copy()
+            slot = np.arange(len(df)) // SYMBOLS_PER_SLOT
+        raw = pd.to_numeric(df.iloc[:, 1], errors="coerce").fillna(0).to_numpy()
+        # Throughput in Gbps: raw can be bytes per symbol (e.g. sample .dat); see GBPS_SCALE
+        return CellThroughput(slot=slot, throughput_raw=raw, throughput_gbps=raw * GBPS_SCALE)
     except Exception:
         return None
 
 
-def load_packet_stats_file(filepath: Path) -> pd.DataFrame | None:
+def load_packet_stats_file(filepath: Path) -> CellPacketStats | None:
     """Load one packet statistics .dat file."""
     try:
-        delim = _detect_delimiter(filepath)
-        df = pd.read_csv(filepath, sep=delim, header=None, skipinitialspace=True)
+        df = _read_dat(filepath)
         if df.shape[1] < 2:
             return None
-        df.columns = [f"col_{i}" for i in range(df.shape[1])]
-        time_col = df.columns[0]
         # Assume columns: time, sent, lost (or similar)
-        df["slot"] = _normalize_symbols_to_slots(pd.to_numeric(df[time_col], errors="coerce").fillna(0).astype(int))
-        df["packets_sent"] = pd.to_numeric(df[df.columns[1]], errors="coerce").fillna(0)
-        df["packets_lost"] = pd.to_numeric(df[df.columns[2]] if df.shape[1] > 2 else 0, errors="coerce").fillna(0)
-        df["loss_rate"] = np.where(df["packets_sent"] > 0, df["packets_lost"] / df["packets_sent"], 0)
-        return df[["slot", "packets_sent", "packets_lost", "loss_rate"]].copy()
+        slot = _normalize_symbols_to_slots(pd.to_numeric(df.iloc[:, 0], errors="coerce").fillna(0).astype(int)).to_numpy()
+        sent = pd.to_numeric(df.iloc[:, 1], errors="coerce").fillna(0).to_numpy()
+        if df.shape[1] > 2:
+            lost = pd.to_numeric(df.iloc[:, 2], errors="coerce").fillna(0).to_numpy()
+        else:
+            lost = np.zeros(len(df), dtype=np.int64)
+        loss_rate = np.divide(lost, sent, out=np.zeros(len(df)), where=sent > 0)
+        return CellPacketStats(slot=slot, packets_sent=sent, packets_lost=lost, loss_rate=loss_rate)
     except Exception:
         return None
 
 
 def extract_cell_id_from_filename(filename: str) -> int | None:
     """Extract cell number from filename e.g. cell_01.dat, throughput_5.dat -> 1, 5."""
-    match = re.search(r"(?:cell[_\s]?|cell_id[_\s]?)?(\d{1,2})", filename, re.I)
+    match = _CELL_ID_RE.search(filename)
     if match:
         return int(match.group(1)) % NUM_CELLS
     return None
@@ -93,50 +171,68 @@ def extract_cell_id_from_filename(filename: str) -> int | None:
 def load_all_dat_files(
     throughput_dir: Path = THROUGHPUT_DIR,
     packet_dir: Path = PACKET_STATS_DIR,
-) -> tuple[dict[int, pd.DataFrame], dict[int, pd.DataFrame]]:
-    """Load all .dat files; return throughput_dfs and packet_dfs keyed by cell_id (0..23)."""
-    throughput_dfs: dict[int, pd.DataFrame] = {}
-    packet_dfs: dict[int, pd.DataFrame] = {}
-
-    for d, keyed_dfs, loader in [
-        (throughput_dir, throughput_dfs, load_throughput_file),
-        (packet_dir, packet_dfs, load_packet_stats_file),
-    ]:
-        if not d.exists():
-            continue
-        for f in sorted(d.glob("*.dat")):
-            cell_id = extract_cell_id_from_filename(f.name)
-            if cell_id is None:
-                cell_id = len(keyed_dfs) % NUM_CELLS
-            df = loader(f)
-            if df is not None and not df.empty:
-                keyed_dfs[cell_id] = df
-
-    return throughput_dfs, packet_dfs
-
-
-def correlate_packet_loss(packet_dfs: dict[int, pd.DataFrame], num_slots: int = 120000) -> np.ndarray:
+) -> tuple[dict[int, CellThroughput], dict[int, CellPacketStats]]:
+    """Load all .dat files; return per-cell CellThroughput and CellPacketStats records keyed by cell_id (0..23)."""
+    throughput_data: dict[int, CellThroughput] = {}
+    packet_data: dict[int, CellPacketStats] = {}
+
+    # Overlap reads across all files. This mainly pays off with pyarrow, whose parser releases
+    # the GIL; the np.loadtxt / pd.read_csv fallbacks mostly hold it, so expect little speedup
+    # there. Results are consumed in sorted order so fallback cell ids stay deterministic
+    with ThreadPoolExecutor(max_workers=LOADER_WORKERS) as pool:
+        pending = []
+        for d, keyed, loader in [
+            (throughput_dir, throughput_data, load_throughput_file),
+            (packet_dir, packet_data, load_packet_stats_file),
+        ]:
+            if not d.exists():
+                continue
+            files = sorted(d.glob("*.dat"))
+            pending.append((keyed, files, [pool.submit(loader, f) for f in files]))
+
+        for keyed, files, futures in pending:
+            for f, fut in zip(files, futures):
+                cell_id = extract_cell_id_from_filename(f.name)
+                if cell_id is None:
+                    cell_id = len(keyed) % NUM_CELLS
+                rec = fut.result()
+                if rec is not None and rec.slot.size:
+                    keyed[cell_id] = rec
+
+    return throughput_data, packet_data
+
+
+def correlate_packet_loss(packet_data: dict[int, CellPacketStats], num_slots: int = 120000) -> np.ndarray:
     """
     Build a matrix of loss-rate time series per cell (aligned by slot), then compute pairwise
     correlation. Cells on the same physical link tend to have correlated packet loss.
     """
-    cell_ids = sorted(packet_dfs.keys())
+    cell_ids = sorted(packet_data.keys())
     if len(cell_ids) < 2:
         return np.eye(NUM_CELLS)
 
     # Align to common slot range
-    slot_min = max(df["slot"].min() for df in packet_dfs.values())
-    slot_max = min(df["slot"].max() for df in packet_dfs.values())
+    slot_min = max(rec.slot.min() for rec in packet_data.values())
+    slot_max = min(rec.slot.max() for rec in packet_data.values())
     slots = np.arange(slot_min, min(slot_max + 1, slot_min + num_slots))
 
-    matrix = np.full((len(cell_ids), len(slots)), np.nan)
+    # Slots are a contiguous integer range, so scatter each series straight into its row
+    # (missing slots stay 0) instead of building a reindexed frame per cell
+    matrix = np.zeros((len(cell_ids), len(slots)), dtype=np.float32)
     for i, cid in enumerate(cell_ids):
-        df = packet_dfs[cid]
-        by_slot = df.set_index("slot").reindex(slots)
-        matrix[i, :] = by_slot["loss_rate"].values
+        rec = packet_data[cid]
+        idx = rec.slot - slot_min
+        vals = rec.loss_rate
+        in_range = (idx >= 0) & (idx < len(slots))
+        matrix[i, idx[in_range]] = vals[in_range]
 
     np.nan_to_num(matrix, copy=False, nan=0.0)
-    corr = np.corrcoef(matrix)
+    # Pearson correlation as a single float32 GEMM on standardized rows
+    # (constant rows standardize to 0, matching np.corrcoef + nan_to_num)
+    matrix -= matrix.mean(axis=1, keepdims=True)
+    std = matrix.std(axis=1, keepdims=True)
+    matrix /= np.where(std > 0, std, np.inf)
+    corr = (matrix @ matrix.T) / matrix.shape[1]
     return np.nan_to_num(corr, nan=0.0, posinf=0.0, neginf=0.0)
 
 
@@ -151,7 +247,10 @@ def infer_topology_from_correlation(
         return {}
     # Use average correlation to others as affinity; cluster by similarity
     # Dissimilarity = 1 - correlation (so high corr = low distance)
-    dist = 1 - np.clip(corr_matrix, 0, 1)
+    # 1 - clip(corr, 0, 1) == clip(1 - corr, 0, 1), built in one buffer
+    dist = np.empty_like(corr_matrix)
+    np.subtract(1.0, corr_matrix, out=dist)
+    np.clip(dist, 0, 1, out=dist)
     np.fill_diagonal(dist, 0)
     clustering = AgglomerativeClustering(n_clusters=num_links, metric="precomputed", linkage="average")
     labels = clustering.fit_predict(dist)
@@ -159,7 +258,7 @@ def infer_topology_from_correlation(
 
 
 def aggregate_traffic_per_link(
-    throughput_dfs: dict[int, pd.DataFrame],
+    throughput_data: dict[int, CellThroughput],
     cell_to_link: dict[int, int],
     slot_range: tuple[int, int] | None = None,
     slot_step: int = 2000,
@@ -167,36 +266,40 @@ def aggregate_traffic_per_link(
     """
     Aggregate throughput (Gbps) per link over time. Returns list of {slot, time_sec, link_1_gbps, link_2_gbps, link_3_gbps}.
     """
-    if not throughput_dfs or not cell_to_link:
+    if not throughput_data or not cell_to_link:
         return []
 
-    all_slots = set()
-    for df in throughput_dfs.values():
-        all_slots.update(df["slot"].astype(int).tolist())
-    slots = sorted(all_slots)
+    # Only the span of observed slots matters, so reduce in NumPy rather than building a set
+    slots = np.concatenate([rec.slot.astype(np.int64, copy=False) for rec in throughput_data.values()])
     if slot_range:
-        slots = [s for s in slots if slot_range[0] <= s <= slot_range[1]]
-    if not slots:
+        slots = slots[(slots >= slot_range[0]) & (slots <= slot_range[1])]
+    if slots.size == 0:
         return []
 
-    slot_min, slot_max = min(slots), max(slots)
+    slot_min, slot_max = int(slots.min()), int(slots.max())
     # Downsample by slot_step for 60-second window: 60 * 2000 = 120000 slots -> step 2000 -> 60 points
-    slots_sampled = list(range(slot_min, slot_max + 1, max(1, slot_step)))
+    step = max(1, slot_step)
+    slots_sampled = list(range(slot_min, slot_max + 1, step))
 
     link_ids = sorted(set(cell_to_link.values()))
+    link_index = {lid: i for i, lid in enumerate(link_ids)}
+    link_of_cell = np.array([link_index[cell_to_link.get(cid, 0)] for cid in throughput_data])
+    # One (cell x sampled slot) matrix; first sample per slot, 0 where a cell has no data
+    per_cell = np.zeros((len(throughput_data), len(slots_sampled)))
+    for i, rec in enumerate(throughput_data.values()):
+        uniq, first = np.unique(rec.slot, return_index=True)
+        offset = uniq - slot_min
+        sampled = (offset >= 0) & (offset <= slot_max - slot_min) & (offset % step == 0)
+        per_cell[i, offset[sampled] // step] = rec.throughput_gbps[first[sampled]]
+    link_totals = _reduce_links(per_cell, link_of_cell, len(link_ids))
+
     result = []
-    for slot in slots_sampled:
+    for slot, sums in zip(slots_sampled, link_totals.T.tolist()):
         time_sec = slot * SLOT_DURATION_US / 1e6
-        sums = {lid: 0.0 for lid in link_ids}
-        for cell_id, df in throughput_dfs.items():
-            link_id = cell_to_link.get(cell_id, 0)
-            row = df[df["slot"] == slot]
-            if not row.empty:
-                sums[link_id] += row["throughput_gbps"].iloc[0]
         result.append({
             "slot": slot,
             "time_sec": round(time_sec, 3),
-            **{f"link_{lid+1}_gbps": round(sums[lid], 4) for lid in link_ids},
+            **{f"link_{lid+1}_gbps": round(sums[i], 4) for i, lid in enumerate(link_ids)},
         })
     return result
 
@@ -208,37 +311,48 @@ def run_processing(
 ) -> dict[str, Any]:
     """Load data, infer topology, aggregate traffic; write JSON and return summary."""
     ensure_dirs()
-    throughput_dfs, packet_dfs = load_all_dat_files(throughput_dir, packet_dir)
+    throughput_data, packet_data = load_all_dat_files(throughput_dir, packet_dir)
 
     # If no .dat files found, generate synthetic data for demo
-    if not throughput_dfs and not packet_dfs:
-        throughput_dfs, packet_dfs = generate_synthetic_data()
+    if not throughput_data and not packet_data:
+        throughput_data, packet_data = generate_synthetic_data()
 
-    cell_ids = sorted(set(throughput_dfs.keys()) | set(packet_dfs.keys()))
+    cell_ids = sorted(set(throughput_data.keys()) | set(packet_data.keys()))
     if not cell_ids:
         cell_ids = list(range(NUM_CELLS))
 
-    corr_matrix = correlate_packet_loss(packet_dfs) if packet_dfs else np.eye(len(cell_ids))
+    corr_matrix = correlate_packet_loss(packet_data) if packet_data else np.eye(len(cell_ids))
     cell_to_link = infer_topology_from_correlation(corr_matrix, cell_ids)
 
     # Build topology graph: DU -> Link 1,2,3 -> RU (group of cells) -> Cells
     topology = build_topology_graph(cell_to_link, cell_ids)
 
     aggregated = aggregate_traffic_per_link(
-        throughput_dfs,
+        throughput_data,
         cell_to_link,
         slot_range=None,
         slot_step=2000,
     )
 
     # Congestion summary per cell (e.g. 95th percentile throughput)
+    # Stack all cells (NaN-padded to the longest) so p95/mean are one reduction each
+    tp_ids = [cid for cid in cell_ids if cid in throughput_data]
+    stats = {}
+    if tp_ids:
+        stacked = np.full((len(tp_ids), max(throughput_data[cid].throughput_gbps.size for cid in tp_ids)), np.nan)
+        for i, cid in enumerate(tp_ids):
+            gbps = throughput_data[cid].throughput_gbps
+            stacked[i, :len(gbps)] = gbps
+        p95 = np.nanquantile(stacked, 0.95, axis=1).tolist()
+        means = np.nanmean(stacked, axis=1).tolist()
+        stats = {cid: (p95[i], means[i]) for i, cid in enumerate(tp_ids)}
+
     congestion = {}
     for cid in cell_ids:
-        if cid in throughput_dfs:
-            df = throughput_dfs[cid]
+        if cid in stats:
             congestion[str(cid)] = {
-                "p95_gbps": round(float(df["throughput_gbps"].quantile(0.95)), 4),
-                "mean_gbps": round(float(df["throughput_gbps"].mean()), 4),
+                "p95_gbps": round(stats[cid][0], 4),
+                "mean_gbps": round(stats[cid][1], 4),
                 "link_id": cell_to_link.get(cid, 0),
             }
         else:
@@ -260,19 +374,15 @@ def run_processing(
         "cell_ids": cell_ids,
     }
     output_dir.mkdir(parents=True, exist_ok=True)
-    with open(output_dir / "topology.json", "w") as f:
-        json.dump(topology, f, indent=2)
-    with open(output_dir / "aggregated_traffic.json", "w") as f:
-        json.dump(aggregated, f, indent=2)
-    with open(output_dir / "dashboard.json", "w") as f:
-        json.dump({
-            "congestion": congestion,
-            "link_capacities": link_capacities,
-            "cell_ids": cell_ids,
-            "cell_to_link": summary["cell_to_link"],
-        }, f, indent=2)
-    with open(output_dir / "full_output.json", "w") as f:
-        json.dump(summary, f, indent=2)
+    _write_json(output_dir / "topology.json", topology)
+    _write_json(output_dir / "aggregated_traffic.json", aggregated)
+    _write_json(output_dir / "dashboard.json", {
+        "congestion": congestion,
+        "link_capacities": link_capacities,
+        "cell_ids": cell_ids,
+        "cell_to_link": summary["cell_to_link"],
+    })
+    _write_json(output_dir / "full_output.json", summary)
     return summary
 
 
@@ -299,33 +409,36 @@ def build_topology_graph(cell_to_link: dict[int, int], cell_ids: list[int]) -> d
     return {"nodes": nodes, "edges": edges}
 
 
-def generate_synthetic_data() -> tuple[dict[int, pd.DataFrame], dict[int, pd.DataFrame]]:
+def generate_synthetic_data() -> tuple[dict[int, CellThroughput], dict[int, CellPacketStats]]:
     """Generate synthetic throughput and packet stats for 24 cells when no .dat files exist."""
     np.random.seed(42)
-    throughput_dfs = {}
-    packet_dfs = {}
+    throughput_data = {}
+    packet_data = {}
     # 60 seconds * 2000 slots/s = 120000 slots; use 12000 for lighter synthetic
     num_slots = 12000
     slots = np.arange(num_slots)
+    # Draw every cell at once as (cell x slot) matrices, then slice rows per cell
+    link_ids = np.arange(24) % NUM_LINKS
+    bases = 0.5 + link_ids * 0.3 + np.random.rand(24) * 0.2
+    trends = 0.1 * np.sin(slots / 500)[None, :] + np.random.randn(24, num_slots) * 0.05
+    throughput_gbps = np.clip(bases[:, None] + trends, 0.1, 2.0)
+    loss_bases = 0.002 + link_ids * 0.001 + np.random.rand(24) * 0.002
+    loss_rates = np.clip(loss_bases[:, None] + np.random.randn(24, num_slots) * 0.001, 0, 0.05)
+    packets_sent = np.random.poisson(1000, (24, num_slots))
+    packets_lost = (loss_rates * 1000).astype(int)
     for cell_id in range(24):
-        link_id = cell_id % NUM_LINKS
-        base = 0.5 + link_id * 0.3 + np.random.rand() * 0.2
-        trend = 0.1 * np.sin(slots / 500) + np.random.randn(num_slots) * 0.05
-        throughput_dfs[cell_id] = pd.DataFrame({
-            "slot": slots,
-            "throughput_raw": np.clip(base + trend, 0.1, 2.0) * 1e8,
-            "throughput_gbps": np.clip(base + trend, 0.1, 2.0),
-        })
-        loss_base = 0.002 + link_id * 0.001 + np.random.rand() * 0.002
-        loss_noise = np.random.randn(num_slots) * 0.001
-        loss_rate = np.clip(loss_base + loss_noise, 0, 0.05)
-        packet_dfs[cell_id] = pd.DataFrame({
-            "slot": slots,
-            "packets_sent": np.random.poisson(1000, num_slots),
-            "packets_lost": (loss_rate * 1000).astype(int),
-            "loss_rate": loss_rate,
-        })
-    return throughput_dfs, packet_dfs
+        throughput_data[cell_id] = CellThroughput(
+            slot=slots,
+            throughput_raw=throughput_gbps[cell_id] * 1e8,
+            throughput_gbps=throughput_gbps[cell_id],
+        )
+        packet_data[cell_id] = CellPacketStats(
+            slot=slots,
+            packets_sent=packets_sent[cell_id],
+            packets_lost=packets_lost[cell_id],
+            loss_rate=loss_rates[cell_id],
+        )
+    return throughput_data, packet_data
 
 
 if __name__ == "__main__":
@@ -2,13 +2,21 @@
 FastAPI backend for Intelligent Fronthaul Network Optimization.
 Serves topology, traffic, dashboard, and capacity estimation.
 """
+import json
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.config import OUTPUT_DIR, ensure_dirs
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to json
+    orjson = None
+
+from backend.config import OUTPUT_DIR, THROUGHPUT_DIR, PACKET_STATS_DIR, INPUT_CHECK_INTERVAL_S, ensure_dirs
 from backend.data_processor import run_processing
 from backend.capacity_estimator import estimate_all_links, estimate_link_capacity_gbps
 
@@ -27,21 +35,102 @@ app.add_middleware(
 )
 
 
-def _read_json(name: str) -> Any:
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _read_json(name: str, newer_than: float = 0.0) -> bytes | None:
+    """Raw output/<name>.json, or None if missing or older than newer_than (stale)."""
     path = OUTPUT_DIR / f"{name}.json"
-    if not path.exists():
+    if not path.exists() or path.stat().st_mtime < newer_than:
         return None
-    import json
-    with open(path, "r") as f:
-        return json.load(f)
+    return path.read_bytes()
+
+
+# Payloads served by the GET endpoints: name -> (parsed data, JSON bytes), valid while the
+# input .dat files ("key") are unchanged. The inputs are re-checked at most once per
+# INPUT_CHECK_INTERVAL_S ("next_check"); _CACHE_LOCK serialises checks and pipeline re-runs
+_CACHED_OUTPUTS = ("topology", "aggregated_traffic", "dashboard")
+_CACHE: dict[str, Any] = {"key": None, "payloads": {}, "next_check": float("-inf")}
+_CACHE_LOCK = threading.Lock()
+
+
+def _input_key() -> tuple[tuple[str, float], ...]:
+    """Sorted (path, mtime) of every input .dat, so edits, additions and deletions all change it."""
+    return tuple(sorted(
+        (str(f), f.stat().st_mtime)
+        for d in (THROUGHPUT_DIR, PACKET_STATS_DIR) if d.exists() for f in d.glob("*.dat")
+    ))
+
+
+def _payloads_from_summary(summary: dict[str, Any]) -> dict[str, tuple[Any, bytes]]:
+    """Same payloads as output/<name>.json, built from a run_processing() summary."""
+    views = {
+        "topology": summary["topology"],
+        "aggregated_traffic": summary["aggregated_traffic"],
+        "dashboard": {k: summary[k] for k in ("congestion", "link_capacities", "cell_ids", "cell_to_link")},
+    }
+    return {name: (data, _dumps(data)) for name, data in views.items()}
+
+
+def _refresh(key: tuple) -> dict[str, Any]:
+    """Re-run the pipeline and rebuild every cached payload from its summary. Hold _CACHE_LOCK."""
+    summary = run_processing()
+    _CACHE["key"] = key
+    _CACHE["payloads"] = _payloads_from_summary(summary)
+    _CACHE["next_check"] = time.monotonic() + INPUT_CHECK_INTERVAL_S
+    return summary
+
+
+def _cached(name: str) -> tuple[Any, bytes]:
+    """
+    Return (data, JSON bytes) for output/<name>.json. The file is read and parsed once; the
+    pipeline re-runs only if the output is missing, older than the inputs, or the input .dat
+    files changed since. Between input checks a cached payload is served without any I/O.
+    """
+    payload = _CACHE["payloads"].get(name)
+    if payload is not None and time.monotonic() < _CACHE["next_check"]:
+        return payload
+    with _CACHE_LOCK:
+        if time.monotonic() >= _CACHE["next_check"]:
+            key = _input_key()
+            _CACHE["next_check"] = time.monotonic() + INPUT_CHECK_INTERVAL_S
+            if _CACHE["key"] is None:
+                _CACHE["key"] = key
+            elif _CACHE["key"] != key:
+                _refresh(key)
+        payloads = _CACHE["payloads"]
+        if name not in payloads:
+            key = _CACHE["key"]
+            raw = _read_json(name, newer_than=max((mtime for _, mtime in key), default=0.0))
+            if raw is None:
+                _refresh(key)
+            else:
+                payloads[name] = (_loads(raw), raw)
+        return _CACHE["payloads"][name]
+
+
+def _json_response(name: str, default: Any) -> Any:
+    data, raw = _cached(name)
+    if not data:
+        return default
+    return Response(content=raw, media_type="application/json")
 
 
 @app.on_event("startup")
 def startup():
     ensure_dirs()
-    # Precompute data if not present
-    if not (OUTPUT_DIR / "dashboard.json").exists():
-        run_processing()
+    # Precompute data if not present, and warm the payload cache
+    for name in _CACHED_OUTPUTS:
+        _cached(name)
 
 
 @app.get("/")
@@ -52,47 +141,33 @@ def root():
 @app.post("/api/process")
 def process_data():
     """Re-run data processing (load .dat files, infer topology, aggregate traffic)."""
-    result = run_processing()
+    with _CACHE_LOCK:
+        result = _refresh(_input_key())
     return {"status": "ok", "cells": len(result["cell_ids"]), "link_capacities": result["link_capacities"]}
 
 
 @app.get("/api/topology")
 def get_topology():
     """Return DU -> Link -> RU -> Cell graph for visualization."""
-    data = _read_json("topology")
-    if data is None:
-        run_processing()
-        data = _read_json("topology")
-    return data or {"nodes": [], "edges": []}
+    return _json_response("topology", {"nodes": [], "edges": []})
 
 
 @app.get("/api/traffic")
 def get_traffic():
     """Return aggregated traffic per link over time (60s window)."""
-    data = _read_json("aggregated_traffic")
-    if data is None:
-        run_processing()
-        data = _read_json("aggregated_traffic")
-    return data or []
+    return _json_response("aggregated_traffic", [])
 
 
 @app.get("/api/dashboard")
 def get_dashboard():
     """Dashboard: congestion per cell, link capacities, cell-to-link mapping."""
-    data = _read_json("dashboard")
-    if data is None:
-        run_processing()
-        data = _read_json("dashboard")
-    return data or {"congestion": {}, "link_capacities": {}, "cell_ids": [], "cell_to_link": {}}
+    return _json_response("dashboard", {"congestion": {}, "link_capacities": {}, "cell_ids": [], "cell_to_link": {}})
 
 
 @app.get("/api/capacity")
 def get_capacity(with_buffer: bool = Query(True, description="Include buffer (4 symbols / 143 μs)")):
     """Capacity estimates per link: with and without buffer, 1% packet loss budget."""
-    dash = _read_json("dashboard")
-    if dash is None:
-        run_processing()
-        dash = _read_json("dashboard")
+    dash, _ = _cached("dashboard")
     link_caps = dash.get("link_capacities", {}) if dash else {}
     estimates = estimate_all_links(link_caps, with_buffer=with_buffer)
     return {"with_buffer": with_buffer, "estimates": estimates, "link_capacities": link_caps}
@@ -12,6 +12,12 @@ PACKET_DIR = PROJECT_ROOT / "data" / "packet_stats"
 SYMBOLS_PER_SLOT = 14
 NUM_SLOTS = 12000  # ~6 sec at 2000 slots/s
 
+def write_dat(path, rows, fmt):
+    """Write a 2-D array as tab-delimited text in one formatting pass (same output as np.savetxt)."""
+    line = "\t".join([fmt] * rows.shape[1]) + "\n"
+    with open(path, "w") as f:
+        f.write(line * rows.shape[0] % tuple(rows.ravel().tolist()))
+
 def main():
     THROUGHPUT_DIR.mkdir(parents=True, exist_ok=True)
     PACKET_DIR.mkdir(parents=True, exist_ok=True)
@@ -25,13 +31,13 @@ def main():
         symbols = slots * SYMBOLS_PER_SLOT
         bytes_per_symbol = (throughput_gbps * 1e9 / 8) * (500e-6 / SYMBOLS_PER_SLOT)  # 500 us per slot
         th = np.column_stack([symbols, bytes_per_symbol])
-        np.savetxt(THROUGHPUT_DIR / f"throughput_cell_{cell_id:02d}.dat", th, fmt="%.2f", delimiter="\t")
+        write_dat(THROUGHPUT_DIR / f"throughput_cell_{cell_id:02d}.dat", th, "%.2f")
         loss_base = 0.002 + link_id * 0.001 + np.random.rand() * 0.002
         loss_rate = np.clip(loss_base + np.random.randn(NUM_SLOTS) * 0.001, 0, 0.05)
         sent = np.random.poisson(1000, NUM_SLOTS)
         lost = (loss_rate * sent).astype(int)
         ps = np.column_stack([symbols, sent, lost])
-        np.savetxt(PACKET_DIR / f"packet_stats_cell_{cell_id:02d}.dat", ps, fmt="%d", delimiter="\t")
+        write_dat(PACKET_DIR / f"packet_stats_cell_{cell_id:02d}.dat", ps, "%d")
     print(f"Generated 24 throughput and 24 packet_stats .dat files in {PROJECT_ROOT / 'data'}")
 
 if __name__ == "__main__":